@@ -1,10 +1,13 @@
 """The graph structure used to represent knitted objects"""
-import networkx
+from array import array
 
 from knit_graphs.Loop import Loop
 from knit_graphs.Pull_Direction import Pull_Direction
 from knit_graphs.Yarn import Yarn
 
+# position of each stitch property in the interned edge attribute tuples
+_STITCH_PROPERTY_INDEX: dict[str, int] = {"pull_direction": 0, "depth": 1, "parent_offset": 2}
+
 
 class Course:
     """
@@ -12,8 +15,9 @@ class Course:
     """
 
     def __init__(self):
-        self.loops_by_id_in_order: list[int] = []
+        self.loops_by_id_in_order: array = array("q")
         self.loops_by_id: dict[int, Loop] = {}
+        self._pos: dict[int, int] = {}
 
     def add_loop(self, loop: Loop, index: int or None = None):
         """
@@ -21,13 +25,18 @@ class Course:
         :param loop: loop to add
         :param index: index to insert at or None if adding to end
         """
-        for parent_loop in loop.parent_loops:
-            assert parent_loop not in self, f"{loop} has parent {parent_loop}, cannot be added to same course"
+        assert loop.parent_ids.isdisjoint(self.loops_by_id.keys()), \
+            f"{loop} has parents {loop.parent_ids & self.loops_by_id.keys()}, cannot be added to same course"
         self.loops_by_id[loop.loop_id] = loop
         if index is None:
+            self._pos[loop.loop_id] = len(self.loops_by_id_in_order)
             self.loops_by_id_in_order.append(loop.loop_id)
         else:
+            # positions shift for every loop from the insertion point onward
+            start = slice(index, None).indices(len(self.loops_by_id_in_order))[0]
             self.loops_by_id_in_order.insert(index, loop.loop_id)
+            for position in range(start, len(self.loops_by_id_in_order)):
+                self._pos[self.loops_by_id_in_order[position]] = position
 
     def __getitem__(self, index: int) -> int:
         return self.loops_by_id_in_order[index]
@@ -38,14 +47,14 @@ class Course:
         :param loop_id: loop_id or loop to find
         :return: index of the loop_id
         """
-        if isinstance(loop_id, Loop):
-            loop_id = loop_id.loop_id
-        return self.loops_by_id_in_order.index(loop_id)
+        loop_id = getattr(loop_id, "loop_id", loop_id)
+        try:
+            return self._pos[loop_id]
+        except KeyError:
+            raise ValueError(f"{loop_id} is not in course") from None
 
     def __contains__(self, loop_id: int or Loop) -> bool:
-        if isinstance(loop_id, Loop):
-            loop_id = loop_id.loop_id
-        return loop_id in self.loops_by_id
+        return getattr(loop_id, "loop_id", loop_id) in self.loops_by_id
 
     def __iter__(self):
         return self.loops_by_id_in_order.__iter__()
@@ -54,7 +63,7 @@ class Course:
         return len(self.loops_by_id_in_order)
 
     def __str__(self):
-        return str(self.loops_by_id_in_order)
+        return str(self.loops_by_id_in_order.tolist())
 
     def __repr__(self):
         return str(self)
@@ -67,8 +76,6 @@ class Knit_Graph:
 
     Attributes
     ----------
-    graph : networkx.DiGraph
-        the directed-graph structure of loops pulled through other loops.
     loops: Dict[int, Loop]
         A map of each unique loop id to its loop
     yarns: Dict[str, Yarn]
@@ -76,10 +83,23 @@ class Knit_Graph:
     """
 
     def __init__(self):
-        self.graph: networkx.DiGraph = networkx.DiGraph()
         self.loops: dict[int, Loop] = {}
+        # the directed-graph structure of loops pulled through other loops, kept as adjacency lists
+        self._succ: dict[int, list[int]] = {}
+        self._pred: dict[int, list[int]] = {}
+        # stitch attributes repeat across most edges, so each edge stores an id into a pool of shared tuples
+        self._edge_attr: dict[tuple[int, int], int] = {}
+        self._attr_pool: list[tuple[Pull_Direction, int, int]] = []
+        self._attr_ids: dict[tuple[Pull_Direction, int, int], int] = {}
         self.last_loop_id: int = -1
         self.yarns: dict[str, Yarn] = {}
+        # the course of each loop id and the loop ids on each course, only valid while _courses_dirty is false
+        self._course_of_loop: dict[int, int] = {}
+        self._courses_index: list[list[int]] = [[]]
+        # set when loops are added or connected out of creation order and the courses must be recovered by get_courses
+        self._courses_dirty: bool = False
+        # true while the loops dict is in loop id order, so ids can be scanned without checking every id up to last_loop_id
+        self._loops_in_id_order: bool = True
 
     def add_loop(self, loop: Loop):
         """
@@ -91,7 +111,8 @@ class Knit_Graph:
         
         if isinstance(loop, Loop):
             # Add the loop as a node in the graph
-            self.graph.add_node(loop.loop_id, loop=loop)
+            self._succ.setdefault(loop.loop_id, [])
+            self._pred.setdefault(loop.loop_id, [])
             
             # Ensure the yarn associated with the loop is part of the graph   
             if loop.yarn not in self.yarns:
@@ -101,6 +122,14 @@ class Knit_Graph:
             if loop not in self.yarns[loop.yarn.yarn_id]:  # make sure the loop is on the yarn specified
                 self.yarns[loop.yarn].add_loop_to_end(loop_id=None, loop=loop, knit_graph=self)
             
+            # Place the new loop on the last course; connect_loops moves it if it is pulled through a loop on that course
+            if loop.loop_id not in self._course_of_loop:
+                if loop.loop_id < self.last_loop_id:
+                    self._loops_in_id_order = False
+                    self._courses_dirty = True
+                self._courses_index[-1].append(loop.loop_id)
+                self._course_of_loop[loop.loop_id] = len(self._courses_index) - 1
+
             # Update the last loop ID if necessary
             if loop.loop_id > self.last_loop_id:
                 self.last_loop_id = loop.loop_id
@@ -108,6 +137,29 @@ class Knit_Graph:
             # Add the loop to the loops dictionary
             self.loops[loop.loop_id] = loop
 
+    def add_loops(self, loops: list[Loop]):
+        """
+        Adds new loops to the end of the graph. Assumes the loops are already on their yarns and are in creation order
+        :param loops: the loops to be added in as nodes in the graph, none of which may already be in the graph
+        """
+        if len(loops) == 0:
+            return
+        loop_ids = [loop.loop_id for loop in loops]
+        assert self.loops.keys().isdisjoint(loop_ids), "loops are already in this graph"
+        for yarn in {loop.yarn for loop in loops}:
+            if yarn.yarn_id not in self.yarns:
+                self.add_yarn(yarn)
+        if loop_ids[0] <= self.last_loop_id:
+            self._loops_in_id_order = False
+            self._courses_dirty = True
+        self.loops.update(zip(loop_ids, loops))
+        self._succ.update((loop_id, []) for loop_id in loop_ids)
+        self._pred.update((loop_id, []) for loop_id in loop_ids)
+        # New loops have no parents yet, so they all start on the last course
+        self._courses_index[-1].extend(loop_ids)
+        self._course_of_loop.update(dict.fromkeys(loop_ids, len(self._courses_index) - 1))
+        self.last_loop_id = max(self.last_loop_id, loop_ids[-1])
+
     def add_yarn(self, yarn: Yarn):
         """
         Adds a yarn to the graph. Assumes that loops do not need to be added
@@ -133,7 +185,15 @@ class Knit_Graph:
         #raise NotImplementedError
         
         # Add an edge in the graph to represent the connection between parent and child loops
-        self.graph.add_edge(parent_loop_id, child_loop_id, pull_direction=pull_direction, depth=depth, parent_offset=parent_offset)
+        edge = (parent_loop_id, child_loop_id)
+        if edge not in self._edge_attr:
+            self._succ[parent_loop_id].append(child_loop_id)
+            self._pred[child_loop_id].append(parent_loop_id)
+        self._edge_attr[edge] = self._intern_edge_attributes(pull_direction, depth, parent_offset)
+
+        # A parent created earlier on the child's course pushes the child onto the next course
+        if parent_loop_id < child_loop_id and self._course_of_loop[parent_loop_id] == self._course_of_loop[child_loop_id]:
+            self._start_course_at(child_loop_id)
         
         # Get references to the parent and child loops
         child_loop = self[child_loop_id]
@@ -142,6 +202,73 @@ class Knit_Graph:
         # Add the parent loop to the child loop's stack of parent_loops
         child_loop.add_parent_loop(parent_loop, stack_position)
 
+    def add_knit_course(self, prev_course_ids_reversed: list[int], yarn: Yarn,
+                        pull_direction: Pull_Direction = Pull_Direction.BtF) -> list[int]:
+        """
+        Adds a new course by making a loop at the end of the yarn for each parent and pulling it through that parent.
+        Equivalent to calling yarn.add_loop_to_end and connect_loops for each parent in order
+        :param prev_course_ids_reversed: the ids of the parent loops in the order their children are made,
+        usually the prior course reversed
+        :param yarn: the yarn the new loops are made on
+        :param pull_direction: the direction every child is pulled through its parent
+        :return: the ids of the new course in the order they were made
+        """
+        child_ids = yarn.add_loops_bulk(len(prev_course_ids_reversed), knit_graph=self)
+        self.bulk_connect(prev_course_ids_reversed, child_ids, pull_direction=pull_direction)
+        return child_ids
+
+    def bulk_connect(self, parent_ids: list[int], child_ids: list[int] or range,
+                     pull_direction: Pull_Direction = Pull_Direction.BtF):
+        """
+        Creates a stitch-edge from each parent to the child at the same position, as connect_loops would one pair at a time
+        :param parent_ids: the ids of the parent loops
+        :param child_ids: the ids of the child loops to pull through the parents at the same position
+        :param pull_direction: the direction every child is pulled through its parent
+        """
+        assert len(parent_ids) == len(child_ids), "every child needs exactly one parent"
+        assert self.loops.keys() >= set(parent_ids), "all parent loops must be in this graph"
+        assert self._edge_attr.keys().isdisjoint(zip(parent_ids, child_ids)), "stitch-edges are already connected"
+        # All edges share one set of stitch properties
+        self._edge_attr.update(dict.fromkeys(zip(parent_ids, child_ids), self._intern_edge_attributes(pull_direction, 0, 0)))
+        for parent_id, child_id in zip(parent_ids, child_ids):
+            self._succ[parent_id].append(child_id)
+            self._pred[child_id].append(parent_id)
+            self.loops[child_id].add_parent_loop(self.loops[parent_id])
+            if parent_id < child_id and self._course_of_loop[parent_id] == self._course_of_loop[child_id]:
+                self._start_course_at(child_id)
+
+    def _start_course_at(self, loop_id: int):
+        """
+        Moves the loop and the loops made after it on its course onto a new course.
+        Used when the loop is pulled through an earlier loop on its own course
+        :param loop_id: the id of the loop that starts the new course
+        """
+        course = self._course_of_loop[loop_id]
+        if course != len(self._courses_index) - 1:  # later courses would need to be re-partitioned too
+            self._courses_dirty = True
+            return
+        course_loop_ids = self._courses_index[course]
+        position = course_loop_ids.index(loop_id)
+        new_course = course_loop_ids[position:]
+        del course_loop_ids[position:]
+        self._courses_index.append(new_course)
+        self._course_of_loop.update(dict.fromkeys(new_course, course + 1))
+
+    def _intern_edge_attributes(self, pull_direction: Pull_Direction, depth: int, parent_offset: int) -> int:
+        """
+        :param pull_direction: the direction the child is pulled through the parent
+        :param depth: the crossing depth of the stitch
+        :param parent_offset: the offset from the child to the parent
+        :return: the id of the shared attribute tuple for these stitch properties
+        """
+        attributes = (pull_direction, depth, parent_offset)
+        attr_id = self._attr_ids.get(attributes)
+        if attr_id is None:
+            attr_id = len(self._attr_pool)
+            self._attr_pool.append(attributes)
+            self._attr_ids[attributes] = attr_id
+        return attr_id
+
     def get_courses(self) -> list[Course]:
         """
         :return: A dictionary of loop_ids to the course they are on,
@@ -149,63 +276,57 @@ class Knit_Graph:
         The first set of loops in the graph is on course 0.
         A course change occurs when a loop has a parent loop that is in the last course.
         """
-        # TODO Implement this method fifth for 1 pt
-        #raise NotImplementedError
-        
-        # Dictionary to store loop_ids to the course they are on
-        loop_ids_to_course_dict = {}
+        if self._courses_dirty:
+            self._partition_courses()
+
+        # The partition already guarantees no loop shares a course with its parent,
+        # so fill the courses directly instead of re-validating through Course.add_loop
+        courses = []
+        for loop_ids in self._courses_index:
+            course = Course()
+            course.loops_by_id_in_order = array("q", loop_ids)
+            course.loops_by_id = {loop_id: self.loops[loop_id] for loop_id in loop_ids}
+            course._pos = {loop_id: position for position, loop_id in enumerate(loop_ids)}
+            courses.append(course)
+        return courses
 
-        # Dictionary to store course ids to the loops on that course in the order of creation
-        course_to_loop_dict = {}
+    def _partition_courses(self):
+        """
+        Recovers _course_of_loop and _courses_index from the stitch edges after loops were added out of creation order
+        """
+        # Loop ids are handed out in creation order, so a single pass in id order visits every loop after all of its parents.
+        # The loops dict is already in that order unless loops were added out of order, so no sort is needed
+        if self._loops_in_id_order:
+            loop_ids = self.loops
+        else:
+            loop_ids = (loop_id for loop_id in range(self.last_loop_id + 1) if loop_id in self.loops)
+
+        course_loop_ids: list[list[int]] = []
 
         # Set to keep track of loops in the current course
-        current_course_set = set()
-        
-        # List to store loops in the current course in the order of creation
-        current_course = []
+        current_course_set: set[int] = set()
 
-        # Used to track the current course number
-        course = 0
+        # List to store loops in the current course in the order of creation
+        current_course: list[int] = []
 
-        # Iterate through sorted loop_ids
-        for loop_id in sorted([*self.graph.nodes]):
-            no_parents_in_course = True
-            
-            # Check if the loop has no parents in the current course
-            for parent_id in self.graph.predecessors(loop_id):
-                if parent_id in current_course_set:
-                    no_parents_in_course = False
-                    break
-
-            # If the loop has no parents in the current course, add it to the current course
-            if no_parents_in_course:
+        # Read the raw parent lists directly, without going through a per-loop accessor
+        parents_by_id = self._pred
+        for loop_id in loop_ids:
+            # A loop with a parent in the current course starts the next course
+            if current_course_set.isdisjoint(parents_by_id[loop_id]):
                 current_course_set.add(loop_id)
                 current_course.append(loop_id)
             else:
-                # Update course_to_loop_ids and reset current_course for the next course
-                course_to_loop_dict[course] = current_course
+                course_loop_ids.append(current_course)
                 current_course = [loop_id]
                 current_course_set = {loop_id}
-                course += 1
-
-            # Update loop_ids_to_course
-            loop_ids_to_course_dict[loop_id] = course
-
-        # Add the loops of the last course to course_to_loop_ids
-        course_to_loop_dict[course] = current_course
 
-        # Create Course instances
-        courses = [Course() for _ in range(course + 1)]  # Create Course instances
+        # Add the loops of the last course
+        course_loop_ids.append(current_course)
 
-        # Add loops to corresponding Course instances
-        for course_id, loop_ids in course_to_loop_dict.items():
-            course_instance = courses[course_id]
-            for loop_id in loop_ids:
-                loop_instance = self.get_loop(loop_id)  # Replace with the actual method
-                course_instance.add_loop(loop_instance)
-
-        return courses
-        
+        self._courses_index = course_loop_ids
+        self._course_of_loop = {loop_id: course for course, loop_ids in enumerate(course_loop_ids) for loop_id in loop_ids}
+        self._courses_dirty = False
 
     def __contains__(self, item):
         """
@@ -213,12 +334,8 @@ class Knit_Graph:
         :param item: the loop being checked for in the graph
         :return: true if the loop_id of item or the loop is in the graph
         """
-        if type(item) is int:
-            return self.graph.has_node(item)
-        elif isinstance(item, Loop):
-            return self.graph.has_node(item.loop_id)
-        else:
-            return False
+        loop_id = getattr(item, "loop_id", item)
+        return type(loop_id) is int and loop_id in self.loops
 
     def get_loop(self, loop_id: int) -> Loop:
         """
@@ -237,7 +354,7 @@ class Knit_Graph:
         if loop_id not in self:
             raise AttributeError
         else:
-            return self.graph.nodes[loop_id]["loop"]
+            return self.loops[loop_id]
 
     def get_stitch_edge(self, parent: Loop or int, child: Loop or int, stitch_property: str or None = None):
         """
@@ -253,11 +370,13 @@ class Knit_Graph:
         child_id = child
         if isinstance(child, Loop):
             child_id = child.loop_id
-        if self.graph.has_edge(parent_id, child_id):
+        attr_id = self._edge_attr.get((parent_id, child_id))
+        if attr_id is not None:
+            attributes = self._attr_pool[attr_id]
             if stitch_property is not None:
-                return self.graph[parent_id][child_id][stitch_property]
+                return attributes[_STITCH_PROPERTY_INDEX[stitch_property]]
             else:
-                return self.graph[parent_id][child_id]
+                return dict(zip(_STITCH_PROPERTY_INDEX, attributes))
         else:
             return None
 
@@ -268,7 +387,7 @@ class Knit_Graph:
         """
         if isinstance(loop_id, Loop):
             loop_id = loop_id.loop_id
-        successors = [*self.graph.successors(loop_id)]
+        successors = self._succ[loop_id]
         if len(successors) == 0:
             return None
         return successors[0]
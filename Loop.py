@@ -77,6 +77,13 @@ class Loop:
         else:
             self.parent_loops.append(parent)
 
+    @property
+    def parent_ids(self) -> set[int]:
+        """
+        :return: the loop ids of the parent_loops, built on each call so loops do not store a second parent collection
+        """
+        return {parent.loop_id for parent in self.parent_loops}
+
     @property
     def loop_id(self) -> int:
         """
@@ -90,7 +97,7 @@ class Loop:
         :return: the id of the loop that comes before this in the knitgraph
         """
         prior_id = self.loop_id - 1
-        if knitGraph.graph.has_node(prior_id):
+        if prior_id in knitGraph:
             return prior_id
         else:
             return None
@@ -101,7 +108,7 @@ class Loop:
         :return: the id of the loop that comes after this in the knitgraph
         """
         next_id = self.loop_id + 1
-        if knitGraph.graph.has_node(next_id):
+        if next_id in knitGraph:
             return next_id
         else:
             return None
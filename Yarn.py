@@ -87,6 +87,34 @@ class Yarn:
         """
         return self.insert_loop(self.last_loop_id, True, loop_id, loop, is_twisted=is_twisted, knit_graph=knit_graph)
 
+    def extend_loops(self, loops: list[Loop]):
+        """
+        Adds the loops to the end of the yarn in the given order. Assumes the loops are not already on the yarn
+        :param loops: the loops to be added to the end of the yarn
+        """
+        if len(loops) == 0:
+            return
+        loop_ids = [loop.loop_id for loop in loops]
+        self.yarn_graph.add_nodes_from((loop.loop_id, {"loop": loop}) for loop in loops)
+        if self.last_loop_id is not None:
+            self.yarn_graph.add_edge(self.last_loop_id, loop_ids[0])
+        self.yarn_graph.add_edges_from(zip(loop_ids, loop_ids[1:]))
+        self.last_loop_id = loop_ids[-1]
+
+    def add_loops_bulk(self, loop_count: int, knit_graph) -> list[int]:
+        """
+        Adds new non-twisted loops to the end of the yarn and the end of the knit graph
+        :param loop_count: the number of loops to add
+        :param knit_graph: the Knit_Graph the loops are added to, used to calculate the new loop ids
+        :return: the ids of the new loops in order
+        """
+        first_id = knit_graph.last_loop_id + 1
+        loop_ids = [*range(first_id, first_id + loop_count)]
+        loops = [Loop(loop_id, self) for loop_id in loop_ids]
+        self.extend_loops(loops)
+        knit_graph.add_loops(loops)
+        return loop_ids
+
     def insert_loop(self, neighbor_loop_id: int, insert_after: bool,
                     loop_id: int = None, loop: Loop or None = None,
                     layer: int = 0, is_twisted: bool = False, knit_graph=None) -> tuple[int, Loop]:
@@ -3,15 +3,17 @@ from knit_graphs.Knit_Graph import Knit_Graph
 from knit_graphs.Pull_Direction import Pull_Direction
 from knit_graphs.Yarn import Yarn
 
+# Lookup tables for the per-stitch pull direction choices, indexed by parity or by the parent's pull direction
+_ALTERNATING_PULL_DIRECTIONS = (Pull_Direction.BtF, Pull_Direction.FtB)
+_OPPOSITE_PULL_DIRECTION = {Pull_Direction.BtF: Pull_Direction.FtB, Pull_Direction.FtB: Pull_Direction.BtF}
+
 
 def cast_on(width: int = 10) -> tuple[Knit_Graph, Yarn, list[int]]:
     knit_graph = Knit_Graph()
     yarn = Yarn("yarn")
     knit_graph.add_yarn(yarn)
-
-    for _ in range(0, width):
-        yarn.add_loop_to_end(knit_graph=knit_graph)
-    return knit_graph, yarn, [*yarn]
+    first_course = yarn.add_loops_bulk(width, knit_graph=knit_graph)
+    return knit_graph, yarn, first_course
 
 
 def jersey_knit(width: int = 10, height: int = 10) -> Knit_Graph:
@@ -23,12 +25,7 @@ def jersey_knit(width: int = 10, height: int = 10) -> Knit_Graph:
 
     knit_graph, yarn, last_course = cast_on(width)
     for r in range(1, height):
-        new_course: list[int] = []
-        for parent_loop_id in reversed(last_course):
-            loop_id, loop = yarn.add_loop_to_end(knit_graph=knit_graph)
-            new_course.append(loop_id)
-            knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF)
-        last_course = new_course
+        last_course = knit_graph.add_knit_course(last_course[::-1], yarn)
     return knit_graph
 
 
@@ -62,28 +59,33 @@ def seed_stitch(width: int = 10, height: int = 10) -> Knit_Graph:
      # Create subsequent rows with alternating knit and purl stitches
     prior_row = first_row
     next_row = []
+    # Pull directions of the loops in next_row, kept in lockstep so the next row can mirror them
+    next_row_dirs = []
     for column, parent_id in enumerate(reversed(prior_row)):
         child_id, child = yarn.add_loop_to_end(knit_graph=knitGraph)
         next_row.append(child_id)
         knitGraph.add_loop(child)
 
         # Alternate the pull direction for seed stitch
-        pull_direction = Pull_Direction.BtF if column % 2 == 0 else Pull_Direction.FtB
+        pull_direction = _ALTERNATING_PULL_DIRECTIONS[column % 2]
+        next_row_dirs.append(pull_direction)
         knitGraph.connect_loops(parent_id, child_id, pull_direction=pull_direction)
 
     # Create additional rows by mirroring the previous row's stitch pattern
     for _ in range(2, height):
         prior_row = next_row
+        prior_dirs = next_row_dirs
         next_row = []
-        for parent_id in reversed(prior_row):
+        next_row_dirs = []
+        for parent_id, parent_pull_direction in zip(reversed(prior_row), reversed(prior_dirs)):
             child_id, child = yarn.add_loop_to_end(knit_graph=knitGraph)
             next_row.append(child_id)
             knitGraph.add_loop(child)
             
             # Use the opposite pull direction from the parent
-            grand_parent = [*knitGraph.graph.predecessors(parent_id)][0]
-            parent_pull_direction = knitGraph.graph[grand_parent][parent_id]["pull_direction"]
-            knitGraph.connect_loops(parent_id, child_id, pull_direction=parent_pull_direction.opposite())
+            pull_direction = _OPPOSITE_PULL_DIRECTION[parent_pull_direction]
+            next_row_dirs.append(pull_direction)
+            knitGraph.connect_loops(parent_id, child_id, pull_direction=pull_direction)
 
     return knitGraph
 
@@ -120,29 +122,32 @@ def kp_rib(width: int = 10, height: int = 10) -> Knit_Graph:
 
     prior_row = first_row
     next_row = []
+    # Pull directions of the loops in next_row, kept in lockstep so the next row can repeat them
+    next_row_dirs = []
 
     # Create alternating columns of knits and purls
-    for column, parent_id in reversed([*enumerate(prior_row)]):
+    last_column = len(prior_row) - 1
+    for i, parent_id in enumerate(reversed(prior_row)):
+        column = last_column - i
         child_id, child = yarn.add_loop_to_end(knit_graph=knitGraph)
         next_row.append(child_id)
         knitGraph.add_loop(child)
         rib_id = int(int(column) / int(rib_width))
-        if rib_id % 2 == 0:  # even ribs:
-            pull_direction = Pull_Direction.BtF
-        else:
-            pull_direction = Pull_Direction.FtB
+        pull_direction = _ALTERNATING_PULL_DIRECTIONS[rib_id % 2]  # even ribs knit, odd ribs purl
+        next_row_dirs.append(pull_direction)
         knitGraph.connect_loops(parent_id, child_id, pull_direction=pull_direction)
 
     # Continue creating the pattern for the specified height
     for _ in range(2, height):
         prior_row = next_row
+        prior_dirs = next_row_dirs
         next_row = []
-        for parent_id in reversed(prior_row):
+        next_row_dirs = []
+        for parent_id, parent_pull_direction in zip(reversed(prior_row), reversed(prior_dirs)):
             child_id, child = yarn.add_loop_to_end(knit_graph=knitGraph)
             next_row.append(child_id)
             knitGraph.add_loop(child)
-            grand_parent = [*knitGraph.graph.predecessors(parent_id)][0]
-            parent_pull_direction = knitGraph.graph[grand_parent][parent_id]["pull_direction"]
+            next_row_dirs.append(parent_pull_direction)
             knitGraph.connect_loops(parent_id, child_id, pull_direction=parent_pull_direction)
 
     return knitGraph
@@ -157,22 +162,22 @@ def lace(width: int = 12, height: int = 10) -> Knit_Graph:
     assert width % 6 == 0, "Lace must be a repeat of 6 stitches"
     knit_graph, yarn, last_course = cast_on(width)
     for r in range(1, height):
+        reversed_course = last_course[::-1]
+        if r % 2 == 0:  # even rows knit across
+            last_course = knit_graph.add_knit_course(reversed_course, yarn)
+            continue
         new_course: list[int] = []
-        reversed_course = [*reversed(last_course)]
         for i, parent_loop_id in enumerate(reversed_course):
             loop_id, loop = yarn.add_loop_to_end(knit_graph=knit_graph)
             new_course.append(loop_id)
-            if r % 2 == 0:  # even rows knit across
+            if i % 6 in [0, 5]:  # knits
                 knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF)
-            else:
-                if i % 6 in [0, 5]:  # knits
-                    knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF)
-                elif i % 6 == 1:
-                    knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=1)
-                    knit_graph.connect_loops(parent_loop_id=reversed_course[i + 1], child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=0, parent_offset=1)
-                elif i % 6 == 4:
-                    knit_graph.connect_loops(parent_loop_id=reversed_course[i - 1], child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=0, parent_offset=-1)
-                    knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=1)
+            elif i % 6 == 1:
+                knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=1)
+                knit_graph.connect_loops(parent_loop_id=reversed_course[i + 1], child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=0, parent_offset=1)
+            elif i % 6 == 4:
+                knit_graph.connect_loops(parent_loop_id=reversed_course[i - 1], child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=0, parent_offset=-1)
+                knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, stack_position=1)
         last_course = new_course
     return knit_graph
 
@@ -186,24 +191,25 @@ def cable(width: int = 10, height: int = 10) -> Knit_Graph:
     assert width % 5 == 0, "Cable must be a repeat of 5 stitches"
     knit_graph, yarn, last_course = cast_on(width)
     for r in range(1, height):
+        if r % 2 == 0:  # even rows knit across
+            last_course = knit_graph.add_knit_course(last_course[::-1], yarn)
+            continue
         new_course: list[int] = []
         cable_course: list[int] = []
-        reserved_course = [*reversed(last_course)]
-        for l, parent_loop_id in enumerate(reserved_course):
+        for l, parent_loop_id in enumerate(last_course[::-1]):
             loop_id, loop = yarn.add_loop_to_end(knit_graph=knit_graph)
             new_course.append(loop_id)
-            if r % 2 == 0:  # even rows knit across
+            if l % 5 in [0, 4]:
                 knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF)
-            else:
-                if l % 5 in [0, 4]:
-                    knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF)
-                    cable_course.append(loop_id)
-                elif l % 5 in [3, 2]:
-                    cable_course.insert(-1, loop_id)
-                    knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, depth=-1, parent_offset=1)
-                elif l % 5 == 1:
-                    cable_course.append(loop_id)
-                    knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, depth=1, parent_offset=-2)
+                if l % 5 == 4:  # the two crossed loops sit before the loop that crossed over them
+                    cable_course[-3], cable_course[-2], cable_course[-1] = cable_course[-2], cable_course[-1], cable_course[-3]
+                cable_course.append(loop_id)
+            elif l % 5 in [3, 2]:
+                cable_course.append(loop_id)
+                knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, depth=-1, parent_offset=1)
+            elif l % 5 == 1:
+                cable_course.append(loop_id)
+                knit_graph.connect_loops(parent_loop_id=parent_loop_id, child_loop_id=loop_id, pull_direction=Pull_Direction.BtF, depth=1, parent_offset=-2)
         if len(cable_course) > 0:
             new_course = cable_course
         last_course = new_course